@@ -0,0 +1,45 @@
+"""
+Regenerate parsing_table.py from the grammar in parser.py.
+
+Run this after changing Grammar.rules:
+    python3 build_tables.py
+"""
+from parser import SLRParser
+
+OUTPUT = "parsing_table.py"
+
+def write_tables(slr_parser: SLRParser, path: str = OUTPUT):
+    grammar = slr_parser.grammar
+    action, default_reduce = slr_parser.compress_action_table()
+    # Sort entries so the generated file is stable between runs
+    action = sorted(action.items())
+    goto = sorted((k, v) for k, v in slr_parser.parsing_table.items() if k[1] in grammar.nonterminals)
+    
+    lines = ['"""Generated by build_tables.py - do not edit by hand."""', ""]
+    lines.append("RULES = [")
+    lines += [f"    {rule!r}," for rule in grammar.rules]
+    lines.append("]")
+    lines.append("")
+    lines.append("FOLLOW = {")
+    lines += [f"    {nt!r}: {tuple(sorted(follow))!r}," for nt, follow in sorted(slr_parser.follow_sets.items())]
+    lines.append("}")
+    lines.append("")
+    lines.append("# Reduce entries of each state's default rule are left out of ACTION")
+    lines.append("DEFAULT_REDUCE = {")
+    lines += [f"    {state!r}: {rule_idx!r}," for state, rule_idx in sorted(default_reduce.items())]
+    lines.append("}")
+    lines.append("")
+    lines.append("ACTION = {")
+    lines += [f"    {key!r}: {value!r}," for key, value in action]
+    lines.append("}")
+    lines.append("")
+    lines.append("GOTO = {")
+    lines += [f"    {key!r}: {value!r}," for key, value in goto]
+    lines.append("}")
+    
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+if __name__ == "__main__":
+    write_tables(SLRParser(precomputed=False))
+    print(f"Wrote {OUTPUT}")
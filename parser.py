@@ -1,20 +1,43 @@
+import re
+from collections import deque
 from typing import List, Tuple, Union, Dict, Set
 
+# Packed ACTION cells: the action kind above KIND_SHIFT, the state or rule below
+ERROR, SHIFT, REDUCE, ACCEPT = 0, 1, 2, 3
+KIND_SHIFT = 28
+PAYLOAD_MASK = (1 << KIND_SHIFT) - 1
+
+# Raw tokens that normalize to a fixed terminal
+_EXACT_TOKENS = {"$": "$", "int": "type", "float": "type", "bool": "type", "void": "type",
+                 "identifier": "id", "number": "num"}
+# Any token starting with "id" or "num" is an identifier or number
+_ID_OR_NUM = re.compile(r"id|num")
+
+# LR(0) items (rule_idx, dot_pos) packed into one int: rule_idx << DOT_BITS | dot_pos
+DOT_BITS = 8
+DOT_MASK = (1 << DOT_BITS) - 1
+
 class ParseTree:
+    __slots__ = ("symbol", "children")
+    
     def __init__(self, symbol: str, children: List['ParseTree'] = None):
         self.symbol = symbol
-        self.children = children or []
+        self.children = children if children is not None else []
     
     def __str__(self):
-        return self._str_helper(0)
-    
-    def _str_helper(self, depth):
-        indent = "  " * depth
-        result = f"{indent}{self.symbol}"
-        if self.children:
-            for child in self.children:
-                result += "\n" + child._str_helper(depth + 1)
-        return result
+        # Iterative pre-order walk; indents[d] is the prefix for depth d
+        lines = []
+        indents = [""]
+        stack = [(self, 0)]
+        while stack:
+            node, depth = stack.pop()
+            lines.append(indents[depth] + node.symbol)
+            if node.children:
+                depth += 1
+                if depth == len(indents):
+                    indents.append("  " * depth)
+                stack.extend([(child, depth) for child in reversed(node.children)])
+        return "\n".join(lines)
 
 class ErrorReport:
     def __init__(self, position: int, message: str):
@@ -22,225 +45,369 @@ class ErrorReport:
         self.message = message
 
 class Grammar:
+    # The grammar is fixed, so its definition is shared by every instance
+    rules = [
+        ("Program'", ("Program",)),  # Augmented start
+        ("Program", ("DeclList",)),
+        ("DeclList", ("Decl", "DeclList")),
+        ("DeclList", ()),  # epsilon
+        ("Decl", ("VarDecl",)),
+        ("Decl", ("FuncDecl",)),
+        ("VarDecl", ("type", "id", ";")),
+        ("VarDecl", ("type", "id", "=", "Expr", ";")),
+        ("FuncDecl", ("type", "id", "(", "ParamList", ")", "Block")),
+        ("ParamList", ("Param", "ParamRest")),
+        ("ParamList", ()),  # epsilon
+        ("ParamRest", (",", "Param", "ParamRest")),
+        ("ParamRest", ()),  # epsilon
+        ("Param", ("type", "id")),
+        ("Block", ("{", "StmtList", "}")),
+        ("StmtList", ("Stmt", "StmtList")),
+        ("StmtList", ()),  # epsilon
+        ("Stmt", ("MatchedStmt",)),
+        ("Stmt", ("UnmatchedStmt",)),
+        ("MatchedStmt", ("if", "(", "Expr", ")", "MatchedStmt", "else", "MatchedStmt")),
+        ("MatchedStmt", ("while", "(", "Expr", ")", "MatchedStmt")),
+        ("MatchedStmt", ("for", "(", "Expr", ";", "Expr", ";", "Expr", ")", "MatchedStmt")),
+        ("MatchedStmt", ("return", "Expr", ";")),
+        ("MatchedStmt", ("VarDecl",)),
+        ("MatchedStmt", ("ExprStmt",)),
+        ("MatchedStmt", ("Block",)),
+        ("UnmatchedStmt", ("if", "(", "Expr", ")", "Stmt")),
+        ("UnmatchedStmt", ("if", "(", "Expr", ")", "MatchedStmt", "else", "UnmatchedStmt")),
+        ("UnmatchedStmt", ("while", "(", "Expr", ")", "UnmatchedStmt")),
+        ("UnmatchedStmt", ("for", "(", "Expr", ";", "Expr", ";", "Expr", ")", "UnmatchedStmt")),
+        ("ExprStmt", ("id", "=", "Expr", ";")),
+        ("Expr", ("EqlExpr",)),
+        ("EqlExpr", ("EqlExpr", "==", "AddExpr")),
+        ("EqlExpr", ("AddExpr",)),
+        ("AddExpr", ("AddExpr", "+", "MulExpr")),
+        ("AddExpr", ("MulExpr",)),
+        ("MulExpr", ("MulExpr", "*", "UnaryExpr")),
+        ("MulExpr", ("UnaryExpr",)),
+        ("UnaryExpr", ("-", "UnaryExpr")),
+        ("UnaryExpr", ("Primary",)),
+        ("Primary", ("id", "(", "ArgList", ")")),
+        ("Primary", ("id",)),
+        ("Primary", ("num",)),
+        ("Primary", ("(", "Expr", ")")),
+        ("ArgList", ("Expr", "ArgRest")),
+        ("ArgList", ()),  # epsilon
+        ("ArgRest", (",", "Expr", "ArgRest")),
+        ("ArgRest", ()),  # epsilon
+    ]
+    
+    start_symbol = "Program'"
+    terminals = frozenset({"type", "id", ";", "=", "(", ")", ",", "{", "}", "if", "else",
+                           "while", "for", "return", "==", "+", "*", "-", "num", "$"})
+    nonterminals = frozenset(rule[0] for rule in rules)
+    
     def __init__(self):
-        # Define the grammar rules
-        self.rules = [
-            ("Program'", ["Program"]),  # Augmented start
-            ("Program", ["DeclList"]),
-            ("DeclList", ["Decl", "DeclList"]),
-            ("DeclList", []),  # epsilon
-            ("Decl", ["VarDecl"]),
-            ("Decl", ["FuncDecl"]),
-            ("VarDecl", ["type", "id", ";"]),
-            ("VarDecl", ["type", "id", "=", "Expr", ";"]),
-            ("FuncDecl", ["type", "id", "(", "ParamList", ")", "Block"]),
-            ("ParamList", ["Param", "ParamRest"]),
-            ("ParamList", []),  # epsilon
-            ("ParamRest", [",", "Param", "ParamRest"]),
-            ("ParamRest", []),  # epsilon
-            ("Param", ["type", "id"]),
-            ("Block", ["{", "StmtList", "}"]),
-            ("StmtList", ["Stmt", "StmtList"]),
-            ("StmtList", []),  # epsilon
-            ("Stmt", ["MatchedStmt"]),
-            ("Stmt", ["UnmatchedStmt"]),
-            ("MatchedStmt", ["if", "(", "Expr", ")", "MatchedStmt", "else", "MatchedStmt"]),
-            ("MatchedStmt", ["while", "(", "Expr", ")", "MatchedStmt"]),
-            ("MatchedStmt", ["for", "(", "Expr", ";", "Expr", ";", "Expr", ")", "MatchedStmt"]),
-            ("MatchedStmt", ["return", "Expr", ";"]),
-            ("MatchedStmt", ["VarDecl"]),
-            ("MatchedStmt", ["ExprStmt"]),
-            ("MatchedStmt", ["Block"]),
-            ("UnmatchedStmt", ["if", "(", "Expr", ")", "Stmt"]),
-            ("UnmatchedStmt", ["if", "(", "Expr", ")", "MatchedStmt", "else", "UnmatchedStmt"]),
-            ("UnmatchedStmt", ["while", "(", "Expr", ")", "UnmatchedStmt"]),
-            ("UnmatchedStmt", ["for", "(", "Expr", ";", "Expr", ";", "Expr", ")", "UnmatchedStmt"]),
-            ("ExprStmt", ["id", "=", "Expr", ";"]),
-            ("Expr", ["EqlExpr"]),
-            ("EqlExpr", ["EqlExpr", "==", "AddExpr"]),
-            ("EqlExpr", ["AddExpr"]),
-            ("AddExpr", ["AddExpr", "+", "MulExpr"]),
-            ("AddExpr", ["MulExpr"]),
-            ("MulExpr", ["MulExpr", "*", "UnaryExpr"]),
-            ("MulExpr", ["UnaryExpr"]),
-            ("UnaryExpr", ["-", "UnaryExpr"]),
-            ("UnaryExpr", ["Primary"]),
-            ("Primary", ["id", "(", "ArgList", ")"]),
-            ("Primary", ["id"]),
-            ("Primary", ["num"]),
-            ("Primary", ["(", "Expr", ")"]),
-            ("ArgList", ["Expr", "ArgRest"]),
-            ("ArgList", []),  # epsilon
-            ("ArgRest", [",", "Expr", "ArgRest"]),
-            ("ArgRest", []),  # epsilon
-        ]
-        
-        self.start_symbol = "Program'"
-        self.terminals = {"type", "id", ";", "=", "(", ")", ",", "{", "}", "if", "else", 
-                         "while", "for", "return", "==", "+", "*", "-", "num", "$"}
-        self.nonterminals = {rule[0] for rule in self.rules}
+        # Every symbol as a small int ID. Terminals come first, so a symbol
+        # ID is a terminal exactly when it is below num_terminals, and a
+        # terminal's symbol ID is also its ACTION column
+        self.id2sym = sorted(self.terminals) + sorted(self.nonterminals)
+        self.sym2id = {symbol: i for i, symbol in enumerate(self.id2sym)}
+        self.num_terminals = len(self.terminals)
+        self.nonterminal_ids = range(self.num_terminals, len(self.id2sym))
+        
+        # The rules over symbol IDs, which table construction works on
+        self.rule_ids = [(self.sym2id[lhs], tuple(self.sym2id[s] for s in rhs)) for lhs, rhs in self.rules]
+        
+        # Rule indices for each nonterminal ID, in grammar order
+        self.prods_of = {nt: [] for nt in self.nonterminal_ids}
+        for i, (lhs, rhs) in enumerate(self.rule_ids):
+            self.prods_of[lhs].append(i)
+        
+        # Integer column IDs for the ACTION and GOTO tables
+        self.terminal_id = {t: self.sym2id[t] for t in self.terminals}
+        # The start symbol never appears on a RHS, so it gets no GOTO column
+        self.nonterminal_id = {nt: i for i, nt in enumerate(sorted(self.nonterminals - {self.start_symbol}))}
+        
+        # Sets of terminals as bitmasks: one bit per terminal ID, plus epsilon ('')
+        self.terminal_bit = {t: 1 << i for t, i in self.terminal_id.items()}
+        self.epsilon_bit = 1 << len(self.terminal_id)
         
     def get_rule(self, index):
         return self.rules[index]
+    
+    def decode_terminal_mask(self, mask):
+        """Turn a terminal bitmask back into a set of terminal strings"""
+        terminals = {t for t, bit in self.terminal_bit.items() if mask & bit}
+        if mask & self.epsilon_bit:
+            terminals.add('')
+        return terminals
+
+def _normalize_token(token, _exact=_EXACT_TOKENS, _id_or_num=_ID_OR_NUM.match,
+                     _terminals=Grammar.terminals):
+    """Normalize a raw token to a grammar terminal; the defaults bind the
+    lookup tables as fast locals"""
+    exact = _exact.get(token)
+    if exact is not None:
+        return exact
+    prefix = _id_or_num(token)
+    if prefix:
+        return prefix.group()
+    if token.isdigit():
+        return "num"
+    if token in _terminals:
+        return token
+    # Try to extract the actual token value
+    if ":" in token:
+        return token.split(":", 1)[0]
+    return token
 
 class SLRParser:
-    def __init__(self):
+    # Fewest reduce entries a rule needs in a state to become its default
+    DEFAULT_REDUCE_MIN = 2
+    
+    def __init__(self, precomputed: bool = True):
         self.grammar = Grammar()
+        self.nullable = set()
+        self.first_masks = []
         self.first_sets = {}
+        self.first_suffix = []
+        self.follow_masks = []
         self.follow_sets = {}
         self.parsing_table = {}
-        self.build_first_sets()
-        self.build_follow_sets()
-        self.build_parsing_table()
+        # Use the table generated by build_tables.py when it is up to date
+        if not (precomputed and self.load_parsing_table()):
+            self.build_nullable()
+            self.build_first_sets()
+            self.build_first_suffixes()
+            self.build_follow_sets()
+            self.build_parsing_table()
+        self.build_dense_tables()
+        
+        # Tokens spelled exactly like a terminal ("+", ";", "if", ...) share one
+        # leaf node across shifts; trees must not mutate their leaves
+        self.shared_leaves = {t: ParseTree(t) for t in self.grammar.terminals}
+        
+        # Terminal IDs of the raw tokens that need no string tests to classify
+        plain_tokens = [*self.grammar.terminals, "int", "float", "bool", "void", "identifier", "number"]
+        self.token_ids = {token: self.classify_token(token) for token in plain_tokens}
     
-    def build_first_sets(self):
-        # Initialize FIRST sets
-        for symbol in self.grammar.terminals:
-            self.first_sets[symbol] = {symbol}
-        for symbol in self.grammar.nonterminals:
-            self.first_sets[symbol] = set()
-        
-        # Add epsilon to empty string symbol
-        self.first_sets[''] = {''}
-        
-        # Iteratively compute FIRST sets
-        changed = True
-        while changed:
-            changed = False
-            for lhs, rhs in self.grammar.rules:
-                old_size = len(self.first_sets[lhs])
-                
-                if not rhs:  # epsilon production
-                    self.first_sets[lhs].add('')
-                else:
-                    # Compute FIRST of the entire RHS sequence
-                    first_rhs = self.get_first_of_sequence(rhs)
-                    self.first_sets[lhs].update(first_rhs)
-                
-                if len(self.first_sets[lhs]) > old_size:
-                    changed = True
+    def load_parsing_table(self):
+        """Load ACTION/GOTO from parsing_table.py; False if missing or stale"""
+        try:
+            import parsing_table
+        except ImportError:
+            return False
+        if parsing_table.RULES != self.grammar.rules:
+            return False
+        self.follow_sets = {nt: set(terminals) for nt, terminals in parsing_table.FOLLOW.items()}
+        self.parsing_table = self.expand_action_table(parsing_table.ACTION, parsing_table.DEFAULT_REDUCE)
+        self.parsing_table.update(parsing_table.GOTO)
+        return True
     
-    def get_first_of_sequence(self, sequence):
-        """Compute FIRST set for a sequence of symbols"""
-        if not sequence:
-            return {''}
+    def build_nullable(self):
+        """Find the nonterminals that derive the empty string"""
+        rule_ids = self.grammar.rule_ids
+        num_terminals = self.grammar.num_terminals
         
-        result = set()
-        all_have_epsilon = True
+        # remaining[i] counts RHS symbols of rule i not yet known to be nullable
+        remaining = [len(rhs) for lhs, rhs in rule_ids]
+        occurrences = {nt: [] for nt in self.grammar.nonterminal_ids}
+        for rule_idx, (lhs, rhs) in enumerate(rule_ids):
+            for symbol in rhs:
+                if symbol >= num_terminals:
+                    occurrences[symbol].append(rule_idx)
         
-        for symbol in sequence:
-            if symbol in self.grammar.terminals:
-                result.add(symbol)
-                all_have_epsilon = False
-                break
-            elif symbol in self.first_sets:
-                # Add FIRST(symbol) - {epsilon}
-                result.update(self.first_sets[symbol] - {''})
-                # If symbol doesn't have epsilon, stop
-                if '' not in self.first_sets[symbol]:
-                    all_have_epsilon = False
+        self.nullable = set()
+        worklist = deque(lhs for lhs, rhs in rule_ids if not rhs)
+        while worklist:
+            nt = worklist.popleft()
+            if nt in self.nullable:
+                continue
+            self.nullable.add(nt)
+            for rule_idx in occurrences[nt]:
+                remaining[rule_idx] -= 1
+                if remaining[rule_idx] == 0:
+                    worklist.append(rule_ids[rule_idx][0])
+    
+    def build_first_sets(self):
+        # FIRST sets are computed as terminal bitmasks (see Grammar.epsilon_bit),
+        # indexed by symbol ID
+        rule_ids = self.grammar.rule_ids
+        num_terminals = self.grammar.num_terminals
+        eps = self.grammar.epsilon_bit
+        self.first_masks = [1 << t for t in range(num_terminals)]
+        # Nullability is already final, so epsilon bits are set up front and
+        # never have to propagate through the fixpoint below
+        self.first_masks += [eps if nt in self.nullable else 0 for nt in self.grammar.nonterminal_ids]
+        
+        # dependents[X] holds the rules whose FIRST set includes FIRST(X):
+        # those where X appears after a nullable prefix of the RHS
+        dependents = {nt: [] for nt in self.grammar.nonterminal_ids}
+        for rule_idx, (lhs, rhs) in enumerate(rule_ids):
+            for symbol in rhs:
+                if symbol >= num_terminals and rule_idx not in dependents[symbol]:
+                    dependents[symbol].append(rule_idx)
+                if symbol not in self.nullable:
                     break
-            else:
-                # Symbol not yet computed, assume no epsilon for now
-                all_have_epsilon = False
-                break
         
-        # If all symbols can derive epsilon, add epsilon to result
-        if all_have_epsilon:
-            result.add('')
+        # Evaluate every rule once, then re-evaluate only the dependents of
+        # a nonterminal whose FIRST set has grown
+        worklist = deque(range(len(rule_ids)))
+        queued = set(worklist)
+        while worklist:
+            rule_idx = worklist.popleft()
+            queued.discard(rule_idx)
+            lhs, rhs = rule_ids[rule_idx]
+            old = self.first_masks[lhs]
+            # Compute FIRST of the entire RHS sequence (epsilon if empty)
+            new = old | self.get_first_of_sequence(rhs)
+            
+            if new != old:
+                self.first_masks[lhs] = new
+                for dependent in dependents[lhs]:
+                    if dependent not in queued:
+                        queued.add(dependent)
+                        worklist.append(dependent)
         
-        return result
+        self.first_sets = {self.grammar.id2sym[symbol]: self.grammar.decode_terminal_mask(mask)
+                           for symbol, mask in enumerate(self.first_masks)}
+    
+    def get_first_of_sequence(self, sequence):
+        """Compute FIRST for a sequence of symbol IDs, as a terminal bitmask"""
+        eps = self.grammar.epsilon_bit
+        result = 0
+        for symbol in sequence:
+            first = self.first_masks[symbol]
+            result |= first & ~eps
+            if not first & eps:
+                return result
+        
+        # All symbols can derive epsilon
+        return result | eps
+    
+    def build_first_suffixes(self):
+        """Precompute first_suffix[rule_idx][pos] = FIRST(rhs[pos:]) as bitmasks"""
+        eps = self.grammar.epsilon_bit
+        self.first_suffix = []
+        for lhs, rhs in self.grammar.rule_ids:
+            # Walk right to left; the empty suffix at the end derives epsilon
+            suffixes = [eps] * (len(rhs) + 1)
+            for pos in range(len(rhs) - 1, -1, -1):
+                first = self.first_masks[rhs[pos]]
+                if first & eps:
+                    suffixes[pos] = (first & ~eps) | suffixes[pos + 1]
+                else:
+                    suffixes[pos] = first
+            self.first_suffix.append(suffixes)
     
     def build_follow_sets(self):
-        # Initialize FOLLOW sets
-        for symbol in self.grammar.nonterminals:
-            self.follow_sets[symbol] = set()
+        # FOLLOW sets are computed as terminal bitmasks indexed by symbol ID, like FIRST
+        eps = self.grammar.epsilon_bit
+        num_terminals = self.grammar.num_terminals
+        sym2id = self.grammar.sym2id
+        follow = [0] * len(self.grammar.id2sym)
         
         # Start symbol gets $ in its FOLLOW set
-        self.follow_sets["Program'"] = {"$"}
-        
-        changed = True
-        while changed:
-            changed = False
-            for lhs, rhs in self.grammar.rules:
-                for i, symbol in enumerate(rhs):
-                    if symbol in self.grammar.nonterminals:
-                        old_size = len(self.follow_sets[symbol])
-                        
-                        # Get the sequence after this symbol (beta)
-                        beta = rhs[i + 1:]
-                        if beta:
-                            # Add FIRST(beta) - {epsilon} to FOLLOW(symbol)
-                            first_beta = self.get_first_of_sequence(beta)
-                            self.follow_sets[symbol].update(first_beta - {''})
-                            
-                            # If beta can derive epsilon, add FOLLOW(lhs)
-                            if '' in first_beta:
-                                self.follow_sets[symbol].update(self.follow_sets[lhs])
-                        else:
-                            # symbol is at the end, add FOLLOW(lhs)
-                            self.follow_sets[symbol].update(self.follow_sets[lhs])
-                        
-                        if len(self.follow_sets[symbol]) > old_size:
-                            changed = True
+        follow[sym2id[self.grammar.start_symbol]] = 1 << sym2id["$"]
+        
+        # feeds[lhs] holds the nonterminals whose FOLLOW set includes FOLLOW(lhs)
+        feeds = {nt: set() for nt in self.grammar.nonterminal_ids}
+        
+        for rule_idx, (lhs, rhs) in enumerate(self.grammar.rule_ids):
+            for i, symbol in enumerate(rhs):
+                if symbol >= num_terminals:
+                    # FIRST of the sequence after this symbol (beta); epsilon if beta is empty
+                    first_beta = self.first_suffix[rule_idx][i + 1]
+                    
+                    # Add FIRST(beta) - {epsilon} to FOLLOW(symbol)
+                    follow[symbol] |= first_beta & ~eps
+                    
+                    # If beta can derive epsilon, add FOLLOW(lhs)
+                    if first_beta & eps:
+                        feeds[lhs].add(symbol)
+        
+        # Propagate FOLLOW(lhs) into the sets it feeds, revisiting a
+        # nonterminal only after its own FOLLOW set has grown
+        worklist = deque(self.grammar.nonterminal_ids)
+        dirty = set(worklist)
+        while worklist:
+            nt = worklist.popleft()
+            dirty.discard(nt)
+            for symbol in feeds[nt]:
+                new = follow[symbol] | follow[nt]
+                if new != follow[symbol]:
+                    follow[symbol] = new
+                    if symbol not in dirty:
+                        dirty.add(symbol)
+                        worklist.append(symbol)
+        
+        self.follow_masks = follow
+        self.follow_sets = {self.grammar.id2sym[nt]: self.grammar.decode_terminal_mask(follow[nt])
+                            for nt in self.grammar.nonterminal_ids}
     
     def build_lr0_items(self):
-        """Build LR(0) items and states"""
+        """Build LR(0) items and states; items are packed ints (see DOT_BITS)"""
+        rule_ids = self.grammar.rule_ids
+        num_terminals = self.grammar.num_terminals
+        
+        # The (rule, 0) items a nonterminal after the dot adds to a closure:
+        # its own productions and, transitively, those of the nonterminals
+        # they start with. Each is found once with a worklist
+        predicted = {}
+        for nt in self.grammar.nonterminal_ids:
+            items = set()
+            worklist = deque([nt])
+            seen = {nt}
+            while worklist:
+                symbol = worklist.popleft()
+                for i in self.grammar.prods_of[symbol]:
+                    items.add(i << DOT_BITS)
+                    rhs = rule_ids[i][1]
+                    if rhs and rhs[0] >= num_terminals and rhs[0] not in seen:
+                        seen.add(rhs[0])
+                        worklist.append(rhs[0])
+            predicted[nt] = frozenset(items)
+        
         def closure(items):
+            # A single pass over the kernel; predicted already holds the rest
             result = set(items)
-            changed = True
-            while changed:
-                changed = False
-                for item in list(result):
-                    rule_idx, dot_pos = item
-                    lhs, rhs = self.grammar.rules[rule_idx]
-                    if dot_pos < len(rhs) and rhs[dot_pos] in self.grammar.nonterminals:
-                        # Add all productions for this nonterminal
-                        for i, (prod_lhs, prod_rhs) in enumerate(self.grammar.rules):
-                            if prod_lhs == rhs[dot_pos]:
-                                new_item = (i, 0)
-                                if new_item not in result:
-                                    result.add(new_item)
-                                    changed = True
+            for item in items:
+                rhs = rule_ids[item >> DOT_BITS][1]
+                dot_pos = item & DOT_MASK
+                if dot_pos < len(rhs) and rhs[dot_pos] >= num_terminals:
+                    result |= predicted[rhs[dot_pos]]
             return frozenset(result)
         
-        def goto(items, symbol):
-            new_items = set()
-            for rule_idx, dot_pos in items:
-                lhs, rhs = self.grammar.rules[rule_idx]
-                if dot_pos < len(rhs) and rhs[dot_pos] == symbol:
-                    new_items.add((rule_idx, dot_pos + 1))
-            return closure(new_items) if new_items else frozenset()
-        
         # Start with initial item: Program' -> .Program
-        initial_item = (0, 0)
-        initial_state = closure({initial_item})
+        initial_kernel = frozenset({0 << DOT_BITS})
         
-        states = [initial_state]
-        state_map = {initial_state: 0}
+        # A state is determined by its kernel (the items closure starts from),
+        # so states are keyed by kernel and closure runs once per new state.
+        # No two states share a core; LALR-style isocore merging has nothing
+        # to merge here
+        states = [closure(initial_kernel)]
+        state_map = {initial_kernel: 0}
         transitions = {}
         
-        queue = [initial_state]
+        queue = deque([0])
         while queue:
-            state = queue.pop(0)
-            state_idx = state_map[state]
+            state_idx = queue.popleft()
+            state = states[state_idx]
             
-            # Get all symbols that can appear after the dot
-            symbols = set()
-            for rule_idx, dot_pos in state:
-                lhs, rhs = self.grammar.rules[rule_idx]
+            # Group items by the symbol after the dot, with the dot advanced,
+            # in one pass instead of rescanning the state for every symbol
+            kernels = {}
+            for item in state:
+                rhs = rule_ids[item >> DOT_BITS][1]
+                dot_pos = item & DOT_MASK
                 if dot_pos < len(rhs):
-                    symbols.add(rhs[dot_pos])
+                    # item + 1 is the same rule with the dot advanced
+                    kernels.setdefault(rhs[dot_pos], []).append(item + 1)
             
-            # Compute GOTO for each symbol
-            for symbol in symbols:
-                new_state = goto(state, symbol)
-                if new_state:
-                    if new_state not in state_map:
-                        state_map[new_state] = len(states)
-                        states.append(new_state)
-                        queue.append(new_state)
-                    transitions[(state_idx, symbol)] = state_map[new_state]
+            # Compute GOTO for each symbol (sorted by name so state numbering is stable)
+            for symbol in sorted(kernels, key=self.grammar.id2sym.__getitem__):
+                kernel = frozenset(kernels[symbol])
+                if kernel not in state_map:
+                    state_map[kernel] = len(states)
+                    queue.append(len(states))
+                    states.append(closure(kernel))
+                transitions[(state_idx, symbol)] = state_map[kernel]
         
         return states, transitions
     
@@ -251,149 +418,263 @@ class SLRParser:
         # Initialize parsing table
         self.parsing_table = {}
         
-        # Build ACTION and GOTO tables
+        id2sym = self.grammar.id2sym
+        num_terminals = self.grammar.num_terminals
+        accept_id = self.grammar.sym2id["$"]
+        # FOLLOW sets as sorted tuples of terminal IDs, converted once
+        follow_ids = {nt: tuple(t for t in range(num_terminals) if self.follow_masks[nt] >> t & 1)
+                      for nt in self.grammar.nonterminal_ids}
+        
+        # Build ACTION and GOTO tables, filling one row per state by terminal ID
         for i, state in enumerate(states):
+            action_row = [None] * num_terminals
             for item in state:
-                rule_idx, dot_pos = item
-                lhs, rhs = self.grammar.rules[rule_idx]
+                rule_idx, dot_pos = item >> DOT_BITS, item & DOT_MASK
+                lhs, rhs = self.grammar.rule_ids[rule_idx]
                 
                 if dot_pos < len(rhs):
-                    # Shift actions for terminals
-                    symbol = rhs[dot_pos]
-                    if symbol in self.grammar.terminals and (i, symbol) in transitions:
-                        next_state = transitions[(i, symbol)]
-                        if (i, symbol) in self.parsing_table:
+                    # Shift actions for terminals (a terminal's symbol ID is its terminal ID)
+                    t = rhs[dot_pos]
+                    if t < num_terminals and (i, t) in transitions:
+                        next_state = transitions[(i, t)]
+                        if action_row[t] is not None:
                             # Conflict detection
-                            existing = self.parsing_table[(i, symbol)]
-                            if existing != ('shift', next_state):
-                                print(f"Shift/Reduce conflict at state {i}, symbol {symbol}")
-                        self.parsing_table[(i, symbol)] = ('shift', next_state)
+                            if action_row[t] != ('shift', next_state):
+                                print(f"Shift/Reduce conflict at state {i}, symbol {id2sym[t]}")
+                        action_row[t] = ('shift', next_state)
                 else:
                     # Reduce actions
                     if rule_idx == 0:  # Program' -> Program
                         # Accept state
-                        self.parsing_table[(i, "$")] = ('accept',)
+                        action_row[accept_id] = ('accept',)
                     else:
                         # Add reduce actions for all terminals in FOLLOW(lhs)
-                        for terminal in self.follow_sets[lhs]:
-                            if (i, terminal) in self.parsing_table:
+                        for t in follow_ids[lhs]:
+                            if action_row[t] is not None:
                                 # Conflict detection
-                                existing = self.parsing_table[(i, terminal)]
-                                if existing != ('reduce', rule_idx):
-                                    print(f"Reduce/Reduce conflict at state {i}, symbol {terminal}")
+                                if action_row[t] != ('reduce', rule_idx):
+                                    print(f"Reduce/Reduce conflict at state {i}, symbol {id2sym[t]}")
                             else:
-                                self.parsing_table[(i, terminal)] = ('reduce', rule_idx)
+                                action_row[t] = ('reduce', rule_idx)
+            
+            for t, entry in enumerate(action_row):
+                if entry is not None:
+                    self.parsing_table[(i, id2sym[t])] = entry
         
         # Add GOTO entries for nonterminals
         for (state, symbol), next_state in transitions.items():
-            if symbol in self.grammar.nonterminals:
-                self.parsing_table[(state, symbol)] = ('goto', next_state)
+            if symbol >= num_terminals:
+                self.parsing_table[(state, id2sym[symbol])] = ('goto', next_state)
+    
+    def compress_action_table(self):
+        """
+        Split the ACTION entries into a default reduce rule per state plus the
+        entries that differ from it. The default rule covers every terminal in
+        FOLLOW(lhs) without another entry, so expand_action_table restores
+        the table exactly.
+        """
+        counts = {}
+        for (state, symbol), entry in self.parsing_table.items():
+            if entry[0] == 'reduce':
+                counts[(state, entry[1])] = counts.get((state, entry[1]), 0) + 1
+        
+        default_reduce = {}
+        for (state, rule_idx), count in sorted(counts.items()):
+            best = counts.get((state, default_reduce.get(state)), 0)
+            if count >= self.DEFAULT_REDUCE_MIN and count > best:
+                default_reduce[state] = rule_idx
+        
+        action = {}
+        for (state, symbol), entry in self.parsing_table.items():
+            if symbol not in self.grammar.terminals:
+                continue
+            if entry[0] == 'reduce' and default_reduce.get(state) == entry[1]:
+                continue
+            action[(state, symbol)] = entry
+        return action, default_reduce
+    
+    def expand_action_table(self, action, default_reduce):
+        """Rebuild the full ACTION entries from compress_action_table's output"""
+        table = dict(action)
+        for state, rule_idx in default_reduce.items():
+            lhs = self.grammar.rules[rule_idx][0]
+            for terminal in self.follow_sets[lhs]:
+                table.setdefault((state, terminal), ('reduce', rule_idx))
+        return table
+    
+    def build_dense_tables(self):
+        """Copy the parsing table into lists indexed by integer state and symbol IDs"""
+        num_states = 1 + max(state for state, _ in self.parsing_table)
+        terminal_id = self.grammar.terminal_id
+        nonterminal_id = self.grammar.nonterminal_id
+        
+        # ACTION cells are packed ints (kind << KIND_SHIFT | payload, 0 for
+        # error). The extra last column stands for tokens that are not
+        # terminals at all
+        self.unknown_id = len(terminal_id)
+        self.action = [[ERROR] * (len(terminal_id) + 1) for _ in range(num_states)]
+        self.goto = [[-1] * len(nonterminal_id) for _ in range(num_states)]
+        kinds = {'shift': SHIFT, 'reduce': REDUCE, 'accept': ACCEPT}
+        
+        for (state, symbol), entry in self.parsing_table.items():
+            if symbol in terminal_id:
+                payload = entry[1] if len(entry) > 1 else 0
+                self.action[state][terminal_id[symbol]] = kinds[entry[0]] << KIND_SHIFT | payload
+            else:
+                self.goto[state][nonterminal_id[symbol]] = entry[1]
+        
+        # States with identical rows share one row list; rows are read-only from here on
+        self.action = self.share_rows(self.action)
+        self.goto = self.share_rows(self.goto)
+        
+        # LHS and RHS length of each rule, for reductions
+        self.rule_lhs = [lhs for lhs, rhs in self.grammar.rules]
+        self.rule_len = [len(rhs) for lhs, rhs in self.grammar.rules]
+        # GOTO column of each rule's LHS (-1 for Program', which is never reduced)
+        self.rule_lhs_id = [nonterminal_id.get(lhs, -1) for lhs, rhs in self.grammar.rules]
+        
+        # Terminals with an action in each state, sorted, for error messages
+        terminal_names = sorted(terminal_id, key=terminal_id.get)
+        self.expected = [tuple(t for t, code in zip(terminal_names, row) if code != ERROR)
+                         for row in self.action]
+    
+    def share_rows(self, table):
+        """Replace equal rows of a table with one shared list"""
+        unique = {}
+        return [unique.setdefault(tuple(row), row) for row in table]
     
     def normalize_token(self, token):
         """Normalize tokens to match grammar terminals"""
-        if token == "$":
-            return "$"
-        elif token in ["int", "float", "bool", "void"]:
-            return "type"
-        elif token.startswith("id") or token == "identifier":
-            return "id"
-        elif token.startswith("num") or token.isdigit() or token == "number":
-            return "num"
-        elif token in self.grammar.terminals:
-            return token
-        else:
-            # Try to extract the actual token value
-            if ":" in token:
-                return token.split(":")[0]
-            return token
+        return _normalize_token(token)
     
-    def parse(self, tokens):
-        """Parse a list of tokens using SLR parsing"""
-        # Normalize tokens and add end marker
-        normalized_tokens = [self.normalize_token(token) for token in tokens]
-        normalized_tokens.append("$")
-        
-        stack = [0]  # Stack of states
-        symbol_stack = []  # Stack of symbols for parse tree construction
+    def classify_token(self, token):
+        """Terminal ID of a raw token, or unknown_id if it is not a terminal"""
+        return self.grammar.terminal_id.get(_normalize_token(token), self.unknown_id)
+    
+    def parse(self, tokens, build_tree=True):
+        """Parse a list of tokens using SLR parsing; skip the tree unless build_tree"""
+        # Classify tokens to terminal IDs once, up front, and add end marker
+        token_ids = self.token_ids
+        classify_token = self.classify_token
+        lookahead_ids = [token_ids[token] if token in token_ids else classify_token(token) for token in tokens]
+        lookahead_ids.append(token_ids["$"])
+        
+        accepted, moves, index, state = self.drive(lookahead_ids)
+        if not accepted:
+            # Error: no action defined
+            return False, ErrorReport(index, 
+                f"Unexpected token '{tokens[index] if index < len(tokens) else '$'}' at position {index}. Expected one of: {', '.join(self.expected[state])}")
+        if not build_tree:
+            return True, None
+        return True, self.make_tree(tokens, moves)
+    
+    def drive(self, lookahead_ids):
+        """
+        Run the automaton over terminal IDs using integer stacks only.
+        
+        Returns (accepted, moves, index, state). moves lists the steps taken:
+        -1 for a shift, the rule index for a reduction. When not accepted,
+        index and state are where no action was defined.
+        """
+        # Stack of states, preallocated with an explicit stack pointer; it
+        # doubles if a long run of empty reductions ever fills it
+        size = 2 * len(lookahead_ids) + 16
+        stack = [0] * size
+        sp = 1
+        moves = []
         index = 0
         
-        while index < len(normalized_tokens):
-            state = stack[-1]
-            lookahead = normalized_tokens[index]
-            
-            if (state, lookahead) not in self.parsing_table:
-                # Error: no action defined
-                expected = []
-                for (s, t) in self.parsing_table:
-                    if s == state and t in self.grammar.terminals:
-                        expected.append(t)
-                expected = list(set(expected))  # Remove duplicates
-                return False, ErrorReport(index, 
-                    f"Unexpected token '{tokens[index] if index < len(tokens) else '$'}' at position {index}. Expected one of: {', '.join(expected)}")
-            
-            action = self.parsing_table[(state, lookahead)]
+        # Bind everything the loop touches to locals to keep attribute lookups out of it
+        action_table = self.action
+        goto_table = self.goto
+        rule_lhs_id = self.rule_lhs_id
+        rule_len = self.rule_len
+        record = moves.append
+        
+        while True:
+            state = stack[sp - 1]
+            code = action_table[state][lookahead_ids[index]]
+            kind = code >> KIND_SHIFT
             
-            if action[0] == 'shift':
-                next_state = action[1]
-                stack.append(next_state)
-                # Use original token for parse tree
-                original_token = tokens[index] if index < len(tokens) else "$"
-                symbol_stack.append(ParseTree(original_token))
+            if kind == SHIFT:
+                if sp == size:
+                    stack += [0] * size
+                    size *= 2
+                stack[sp] = code & PAYLOAD_MASK
+                sp += 1
+                record(-1)
                 index += 1
             
-            elif action[0] == 'reduce':
-                rule_idx = action[1]
-                lhs, rhs = self.grammar.rules[rule_idx]
-                
-                # Pop |rhs| states and symbols
-                children = []
-                for _ in range(len(rhs)):
-                    if stack:
-                        stack.pop()
-                    if symbol_stack:
-                        children.insert(0, symbol_stack.pop())
-                
-                # Create new parse tree node
-                node = ParseTree(lhs, children)
-                symbol_stack.append(node)
-                
-                # Push GOTO state
-                current_state = stack[-1] if stack else 0
-                if (current_state, lhs) in self.parsing_table:
-                    goto_action = self.parsing_table[(current_state, lhs)]
-                    if goto_action[0] == 'goto':
-                        stack.append(goto_action[1])
-                    else:
-                        return False, ErrorReport(index, f"Expected GOTO action for state {current_state} and symbol {lhs}")
-                else:
-                    return False, ErrorReport(index, f"No GOTO entry for state {current_state} and symbol {lhs}")
+            elif kind == REDUCE:
+                rule_idx = code & PAYLOAD_MASK
+                sp -= rule_len[rule_idx]
+                if sp == size:
+                    stack += [0] * size
+                    size *= 2
+                # GOTO is always defined here: the uncovered state is the one
+                # whose closure added this rule
+                stack[sp] = goto_table[stack[sp - 1]][rule_lhs_id[rule_idx]]
+                sp += 1
+                record(rule_idx)
             
-            elif action[0] == 'accept':
-                # Success! Return the Program node (child of Program')
-                if symbol_stack and symbol_stack[0].children:
-                    return True, symbol_stack[0].children[0]
-                else:
-                    return True, symbol_stack[0] if symbol_stack else ParseTree("Program")
+            elif kind == ACCEPT:
+                return True, moves, index, state
             
             else:
-                return False, ErrorReport(index, f"Unknown action: {action}")
+                return False, moves, index, state
+    
+    def make_tree(self, tokens, moves):
+        """Replay the moves recorded by drive() to build the parse tree"""
+        rule_lhs = self.rule_lhs
+        rule_len = self.rule_len
+        shared_leaves = self.shared_leaves
+        # Stack of symbols for parse tree construction, with an explicit
+        # stack pointer; each move pushes at most one symbol
+        symbol_stack = [None] * len(moves)
+        sp = 0
+        index = 0
         
-        return False, ErrorReport(index, "Unexpected end of input")
+        for move in moves:
+            if move < 0:
+                # Use original token for parse tree
+                token = tokens[index]
+                leaf = shared_leaves.get(token)
+                symbol_stack[sp] = leaf if leaf is not None else ParseTree(token)
+                sp += 1
+                index += 1
+            else:
+                # Pop |rhs| symbols in one slice
+                n = rule_len[move]
+                sp -= n
+                symbol_stack[sp] = ParseTree(rule_lhs[move], symbol_stack[sp:sp + n])
+                sp += 1
+        
+        # Return the Program node's child (Program' is never reduced)
+        if sp and symbol_stack[0].children:
+            return symbol_stack[0].children[0]
+        return symbol_stack[0] if sp else ParseTree("Program")
+    
+# Built lazily on first use; the grammar is fixed, so the tables never change.
+_SLR_PARSER = None
 
-def parser(tokens: List[str]) -> Tuple[bool, Union[ParseTree, ErrorReport]]:
+def parser(tokens: List[str], build_tree: bool = True) -> Tuple[bool, Union[ParseTree, ErrorReport, None]]:
     """
     Parse a list of tokens and return either a parse tree or an error report.
     
     Args:
         tokens: List of tokens to parse
+        build_tree: Build the parse tree; pass False to only check acceptance
         
     Returns:
         Tuple of (success, result) where:
         - success is True if parsing succeeded, False otherwise
-        - result is ParseTree if success=True, ErrorReport if success=False
+        - result is ParseTree if success=True (None if build_tree=False),
+          ErrorReport if success=False
     """
-    slr_parser = SLRParser()
-    return slr_parser.parse(tokens)
+    global _SLR_PARSER
+    if _SLR_PARSER is None:
+        _SLR_PARSER = SLRParser()
+    return _SLR_PARSER.parse(tokens, build_tree)
 
 # Example usage and testing
 if __name__ == "__main__":
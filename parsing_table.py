@@ -0,0 +1,413 @@
+"""Generated by build_tables.py - do not edit by hand."""
+
+RULES = [
+    ("Program'", ('Program',)),
+    ('Program', ('DeclList',)),
+    ('DeclList', ('Decl', 'DeclList')),
+    ('DeclList', ()),
+    ('Decl', ('VarDecl',)),
+    ('Decl', ('FuncDecl',)),
+    ('VarDecl', ('type', 'id', ';')),
+    ('VarDecl', ('type', 'id', '=', 'Expr', ';')),
+    ('FuncDecl', ('type', 'id', '(', 'ParamList', ')', 'Block')),
+    ('ParamList', ('Param', 'ParamRest')),
+    ('ParamList', ()),
+    ('ParamRest', (',', 'Param', 'ParamRest')),
+    ('ParamRest', ()),
+    ('Param', ('type', 'id')),
+    ('Block', ('{', 'StmtList', '}')),
+    ('StmtList', ('Stmt', 'StmtList')),
+    ('StmtList', ()),
+    ('Stmt', ('MatchedStmt',)),
+    ('Stmt', ('UnmatchedStmt',)),
+    ('MatchedStmt', ('if', '(', 'Expr', ')', 'MatchedStmt', 'else', 'MatchedStmt')),
+    ('MatchedStmt', ('while', '(', 'Expr', ')', 'MatchedStmt')),
+    ('MatchedStmt', ('for', '(', 'Expr', ';', 'Expr', ';', 'Expr', ')', 'MatchedStmt')),
+    ('MatchedStmt', ('return', 'Expr', ';')),
+    ('MatchedStmt', ('VarDecl',)),
+    ('MatchedStmt', ('ExprStmt',)),
+    ('MatchedStmt', ('Block',)),
+    ('UnmatchedStmt', ('if', '(', 'Expr', ')', 'Stmt')),
+    ('UnmatchedStmt', ('if', '(', 'Expr', ')', 'MatchedStmt', 'else', 'UnmatchedStmt')),
+    ('UnmatchedStmt', ('while', '(', 'Expr', ')', 'UnmatchedStmt')),
+    ('UnmatchedStmt', ('for', '(', 'Expr', ';', 'Expr', ';', 'Expr', ')', 'UnmatchedStmt')),
+    ('ExprStmt', ('id', '=', 'Expr', ';')),
+    ('Expr', ('EqlExpr',)),
+    ('EqlExpr', ('EqlExpr', '==', 'AddExpr')),
+    ('EqlExpr', ('AddExpr',)),
+    ('AddExpr', ('AddExpr', '+', 'MulExpr')),
+    ('AddExpr', ('MulExpr',)),
+    ('MulExpr', ('MulExpr', '*', 'UnaryExpr')),
+    ('MulExpr', ('UnaryExpr',)),
+    ('UnaryExpr', ('-', 'UnaryExpr')),
+    ('UnaryExpr', ('Primary',)),
+    ('Primary', ('id', '(', 'ArgList', ')')),
+    ('Primary', ('id',)),
+    ('Primary', ('num',)),
+    ('Primary', ('(', 'Expr', ')')),
+    ('ArgList', ('Expr', 'ArgRest')),
+    ('ArgList', ()),
+    ('ArgRest', (',', 'Expr', 'ArgRest')),
+    ('ArgRest', ()),
+]
+
+FOLLOW = {
+    'AddExpr': (')', '+', ',', ';', '=='),
+    'ArgList': (')',),
+    'ArgRest': (')',),
+    'Block': ('$', 'else', 'for', 'id', 'if', 'return', 'type', 'while', '{', '}'),
+    'Decl': ('$', 'type'),
+    'DeclList': ('$',),
+    'EqlExpr': (')', ',', ';', '=='),
+    'Expr': (')', ',', ';'),
+    'ExprStmt': ('else', 'for', 'id', 'if', 'return', 'type', 'while', '{', '}'),
+    'FuncDecl': ('$', 'type'),
+    'MatchedStmt': ('else', 'for', 'id', 'if', 'return', 'type', 'while', '{', '}'),
+    'MulExpr': (')', '*', '+', ',', ';', '=='),
+    'Param': (')', ','),
+    'ParamList': (')',),
+    'ParamRest': (')',),
+    'Primary': (')', '*', '+', ',', ';', '=='),
+    'Program': ('$',),
+    "Program'": ('$',),
+    'Stmt': ('for', 'id', 'if', 'return', 'type', 'while', '{', '}'),
+    'StmtList': ('}',),
+    'UnaryExpr': (')', '*', '+', ',', ';', '=='),
+    'UnmatchedStmt': ('for', 'id', 'if', 'return', 'type', 'while', '{', '}'),
+    'VarDecl': ('$', 'else', 'for', 'id', 'if', 'return', 'type', 'while', '{', '}'),
+}
+
+# Reduce entries of each state's default rule are left out of ACTION
+DEFAULT_REDUCE = {
+    3: 5,
+    5: 4,
+    10: 6,
+    17: 33,
+    18: 31,
+    20: 35,
+    21: 39,
+    22: 37,
+    23: 41,
+    24: 42,
+    28: 13,
+    30: 38,
+    33: 7,
+    37: 8,
+    39: 43,
+    40: 34,
+    41: 32,
+    42: 36,
+    46: 25,
+    47: 24,
+    48: 17,
+    51: 18,
+    52: 23,
+    59: 40,
+    63: 14,
+    74: 22,
+    78: 30,
+    82: 17,
+    83: 26,
+    84: 20,
+    85: 28,
+    89: 19,
+    90: 27,
+    92: 21,
+    93: 29,
+}
+
+ACTION = {
+    (0, '$'): ('reduce', 3),
+    (0, 'type'): ('shift', 6),
+    (1, '$'): ('reduce', 3),
+    (1, 'type'): ('shift', 6),
+    (2, '$'): ('reduce', 1),
+    (4, '$'): ('accept',),
+    (6, 'id'): ('shift', 8),
+    (7, '$'): ('reduce', 2),
+    (8, '('): ('shift', 9),
+    (8, ';'): ('shift', 10),
+    (8, '='): ('shift', 11),
+    (9, ')'): ('reduce', 10),
+    (9, 'type'): ('shift', 14),
+    (11, '('): ('shift', 15),
+    (11, '-'): ('shift', 16),
+    (11, 'id'): ('shift', 23),
+    (11, 'num'): ('shift', 24),
+    (12, ')'): ('reduce', 12),
+    (12, ','): ('shift', 25),
+    (13, ')'): ('shift', 27),
+    (14, 'id'): ('shift', 28),
+    (15, '('): ('shift', 15),
+    (15, '-'): ('shift', 16),
+    (15, 'id'): ('shift', 23),
+    (15, 'num'): ('shift', 24),
+    (16, '('): ('shift', 15),
+    (16, '-'): ('shift', 16),
+    (16, 'id'): ('shift', 23),
+    (16, 'num'): ('shift', 24),
+    (17, '+'): ('shift', 31),
+    (18, '=='): ('shift', 32),
+    (19, ';'): ('shift', 33),
+    (20, '*'): ('shift', 34),
+    (23, '('): ('shift', 35),
+    (25, 'type'): ('shift', 14),
+    (26, ')'): ('reduce', 9),
+    (27, '{'): ('shift', 38),
+    (29, ')'): ('shift', 39),
+    (31, '('): ('shift', 15),
+    (31, '-'): ('shift', 16),
+    (31, 'id'): ('shift', 23),
+    (31, 'num'): ('shift', 24),
+    (32, '('): ('shift', 15),
+    (32, '-'): ('shift', 16),
+    (32, 'id'): ('shift', 23),
+    (32, 'num'): ('shift', 24),
+    (34, '('): ('shift', 15),
+    (34, '-'): ('shift', 16),
+    (34, 'id'): ('shift', 23),
+    (34, 'num'): ('shift', 24),
+    (35, '('): ('shift', 15),
+    (35, ')'): ('reduce', 45),
+    (35, '-'): ('shift', 16),
+    (35, 'id'): ('shift', 23),
+    (35, 'num'): ('shift', 24),
+    (36, ')'): ('reduce', 12),
+    (36, ','): ('shift', 25),
+    (38, 'for'): ('shift', 53),
+    (38, 'id'): ('shift', 54),
+    (38, 'if'): ('shift', 55),
+    (38, 'return'): ('shift', 56),
+    (38, 'type'): ('shift', 57),
+    (38, 'while'): ('shift', 58),
+    (38, '{'): ('shift', 38),
+    (38, '}'): ('reduce', 16),
+    (40, '*'): ('shift', 34),
+    (41, '+'): ('shift', 31),
+    (43, ')'): ('shift', 59),
+    (44, ')'): ('reduce', 47),
+    (44, ','): ('shift', 60),
+    (45, ')'): ('reduce', 11),
+    (49, 'for'): ('shift', 53),
+    (49, 'id'): ('shift', 54),
+    (49, 'if'): ('shift', 55),
+    (49, 'return'): ('shift', 56),
+    (49, 'type'): ('shift', 57),
+    (49, 'while'): ('shift', 58),
+    (49, '{'): ('shift', 38),
+    (49, '}'): ('reduce', 16),
+    (50, '}'): ('shift', 63),
+    (53, '('): ('shift', 64),
+    (54, '='): ('shift', 65),
+    (55, '('): ('shift', 66),
+    (56, '('): ('shift', 15),
+    (56, '-'): ('shift', 16),
+    (56, 'id'): ('shift', 23),
+    (56, 'num'): ('shift', 24),
+    (57, 'id'): ('shift', 68),
+    (58, '('): ('shift', 69),
+    (60, '('): ('shift', 15),
+    (60, '-'): ('shift', 16),
+    (60, 'id'): ('shift', 23),
+    (60, 'num'): ('shift', 24),
+    (61, ')'): ('reduce', 44),
+    (62, '}'): ('reduce', 15),
+    (64, '('): ('shift', 15),
+    (64, '-'): ('shift', 16),
+    (64, 'id'): ('shift', 23),
+    (64, 'num'): ('shift', 24),
+    (65, '('): ('shift', 15),
+    (65, '-'): ('shift', 16),
+    (65, 'id'): ('shift', 23),
+    (65, 'num'): ('shift', 24),
+    (66, '('): ('shift', 15),
+    (66, '-'): ('shift', 16),
+    (66, 'id'): ('shift', 23),
+    (66, 'num'): ('shift', 24),
+    (67, ';'): ('shift', 74),
+    (68, ';'): ('shift', 10),
+    (68, '='): ('shift', 11),
+    (69, '('): ('shift', 15),
+    (69, '-'): ('shift', 16),
+    (69, 'id'): ('shift', 23),
+    (69, 'num'): ('shift', 24),
+    (70, ')'): ('reduce', 47),
+    (70, ','): ('shift', 60),
+    (71, ';'): ('shift', 77),
+    (72, ';'): ('shift', 78),
+    (73, ')'): ('shift', 79),
+    (75, ')'): ('shift', 80),
+    (76, ')'): ('reduce', 46),
+    (77, '('): ('shift', 15),
+    (77, '-'): ('shift', 16),
+    (77, 'id'): ('shift', 23),
+    (77, 'num'): ('shift', 24),
+    (79, 'for'): ('shift', 53),
+    (79, 'id'): ('shift', 54),
+    (79, 'if'): ('shift', 55),
+    (79, 'return'): ('shift', 56),
+    (79, 'type'): ('shift', 57),
+    (79, 'while'): ('shift', 58),
+    (79, '{'): ('shift', 38),
+    (80, 'for'): ('shift', 53),
+    (80, 'id'): ('shift', 54),
+    (80, 'if'): ('shift', 55),
+    (80, 'return'): ('shift', 56),
+    (80, 'type'): ('shift', 57),
+    (80, 'while'): ('shift', 58),
+    (80, '{'): ('shift', 38),
+    (81, ';'): ('shift', 86),
+    (82, 'else'): ('shift', 87),
+    (86, '('): ('shift', 15),
+    (86, '-'): ('shift', 16),
+    (86, 'id'): ('shift', 23),
+    (86, 'num'): ('shift', 24),
+    (87, 'for'): ('shift', 53),
+    (87, 'id'): ('shift', 54),
+    (87, 'if'): ('shift', 55),
+    (87, 'return'): ('shift', 56),
+    (87, 'type'): ('shift', 57),
+    (87, 'while'): ('shift', 58),
+    (87, '{'): ('shift', 38),
+    (88, ')'): ('shift', 91),
+    (91, 'for'): ('shift', 53),
+    (91, 'id'): ('shift', 54),
+    (91, 'if'): ('shift', 55),
+    (91, 'return'): ('shift', 56),
+    (91, 'type'): ('shift', 57),
+    (91, 'while'): ('shift', 58),
+    (91, '{'): ('shift', 38),
+}
+
+GOTO = {
+    (0, 'Decl'): ('goto', 1),
+    (0, 'DeclList'): ('goto', 2),
+    (0, 'FuncDecl'): ('goto', 3),
+    (0, 'Program'): ('goto', 4),
+    (0, 'VarDecl'): ('goto', 5),
+    (1, 'Decl'): ('goto', 1),
+    (1, 'DeclList'): ('goto', 7),
+    (1, 'FuncDecl'): ('goto', 3),
+    (1, 'VarDecl'): ('goto', 5),
+    (9, 'Param'): ('goto', 12),
+    (9, 'ParamList'): ('goto', 13),
+    (11, 'AddExpr'): ('goto', 17),
+    (11, 'EqlExpr'): ('goto', 18),
+    (11, 'Expr'): ('goto', 19),
+    (11, 'MulExpr'): ('goto', 20),
+    (11, 'Primary'): ('goto', 21),
+    (11, 'UnaryExpr'): ('goto', 22),
+    (12, 'ParamRest'): ('goto', 26),
+    (15, 'AddExpr'): ('goto', 17),
+    (15, 'EqlExpr'): ('goto', 18),
+    (15, 'Expr'): ('goto', 29),
+    (15, 'MulExpr'): ('goto', 20),
+    (15, 'Primary'): ('goto', 21),
+    (15, 'UnaryExpr'): ('goto', 22),
+    (16, 'Primary'): ('goto', 21),
+    (16, 'UnaryExpr'): ('goto', 30),
+    (25, 'Param'): ('goto', 36),
+    (27, 'Block'): ('goto', 37),
+    (31, 'MulExpr'): ('goto', 40),
+    (31, 'Primary'): ('goto', 21),
+    (31, 'UnaryExpr'): ('goto', 22),
+    (32, 'AddExpr'): ('goto', 41),
+    (32, 'MulExpr'): ('goto', 20),
+    (32, 'Primary'): ('goto', 21),
+    (32, 'UnaryExpr'): ('goto', 22),
+    (34, 'Primary'): ('goto', 21),
+    (34, 'UnaryExpr'): ('goto', 42),
+    (35, 'AddExpr'): ('goto', 17),
+    (35, 'ArgList'): ('goto', 43),
+    (35, 'EqlExpr'): ('goto', 18),
+    (35, 'Expr'): ('goto', 44),
+    (35, 'MulExpr'): ('goto', 20),
+    (35, 'Primary'): ('goto', 21),
+    (35, 'UnaryExpr'): ('goto', 22),
+    (36, 'ParamRest'): ('goto', 45),
+    (38, 'Block'): ('goto', 46),
+    (38, 'ExprStmt'): ('goto', 47),
+    (38, 'MatchedStmt'): ('goto', 48),
+    (38, 'Stmt'): ('goto', 49),
+    (38, 'StmtList'): ('goto', 50),
+    (38, 'UnmatchedStmt'): ('goto', 51),
+    (38, 'VarDecl'): ('goto', 52),
+    (44, 'ArgRest'): ('goto', 61),
+    (49, 'Block'): ('goto', 46),
+    (49, 'ExprStmt'): ('goto', 47),
+    (49, 'MatchedStmt'): ('goto', 48),
+    (49, 'Stmt'): ('goto', 49),
+    (49, 'StmtList'): ('goto', 62),
+    (49, 'UnmatchedStmt'): ('goto', 51),
+    (49, 'VarDecl'): ('goto', 52),
+    (56, 'AddExpr'): ('goto', 17),
+    (56, 'EqlExpr'): ('goto', 18),
+    (56, 'Expr'): ('goto', 67),
+    (56, 'MulExpr'): ('goto', 20),
+    (56, 'Primary'): ('goto', 21),
+    (56, 'UnaryExpr'): ('goto', 22),
+    (60, 'AddExpr'): ('goto', 17),
+    (60, 'EqlExpr'): ('goto', 18),
+    (60, 'Expr'): ('goto', 70),
+    (60, 'MulExpr'): ('goto', 20),
+    (60, 'Primary'): ('goto', 21),
+    (60, 'UnaryExpr'): ('goto', 22),
+    (64, 'AddExpr'): ('goto', 17),
+    (64, 'EqlExpr'): ('goto', 18),
+    (64, 'Expr'): ('goto', 71),
+    (64, 'MulExpr'): ('goto', 20),
+    (64, 'Primary'): ('goto', 21),
+    (64, 'UnaryExpr'): ('goto', 22),
+    (65, 'AddExpr'): ('goto', 17),
+    (65, 'EqlExpr'): ('goto', 18),
+    (65, 'Expr'): ('goto', 72),
+    (65, 'MulExpr'): ('goto', 20),
+    (65, 'Primary'): ('goto', 21),
+    (65, 'UnaryExpr'): ('goto', 22),
+    (66, 'AddExpr'): ('goto', 17),
+    (66, 'EqlExpr'): ('goto', 18),
+    (66, 'Expr'): ('goto', 73),
+    (66, 'MulExpr'): ('goto', 20),
+    (66, 'Primary'): ('goto', 21),
+    (66, 'UnaryExpr'): ('goto', 22),
+    (69, 'AddExpr'): ('goto', 17),
+    (69, 'EqlExpr'): ('goto', 18),
+    (69, 'Expr'): ('goto', 75),
+    (69, 'MulExpr'): ('goto', 20),
+    (69, 'Primary'): ('goto', 21),
+    (69, 'UnaryExpr'): ('goto', 22),
+    (70, 'ArgRest'): ('goto', 76),
+    (77, 'AddExpr'): ('goto', 17),
+    (77, 'EqlExpr'): ('goto', 18),
+    (77, 'Expr'): ('goto', 81),
+    (77, 'MulExpr'): ('goto', 20),
+    (77, 'Primary'): ('goto', 21),
+    (77, 'UnaryExpr'): ('goto', 22),
+    (79, 'Block'): ('goto', 46),
+    (79, 'ExprStmt'): ('goto', 47),
+    (79, 'MatchedStmt'): ('goto', 82),
+    (79, 'Stmt'): ('goto', 83),
+    (79, 'UnmatchedStmt'): ('goto', 51),
+    (79, 'VarDecl'): ('goto', 52),
+    (80, 'Block'): ('goto', 46),
+    (80, 'ExprStmt'): ('goto', 47),
+    (80, 'MatchedStmt'): ('goto', 84),
+    (80, 'UnmatchedStmt'): ('goto', 85),
+    (80, 'VarDecl'): ('goto', 52),
+    (86, 'AddExpr'): ('goto', 17),
+    (86, 'EqlExpr'): ('goto', 18),
+    (86, 'Expr'): ('goto', 88),
+    (86, 'MulExpr'): ('goto', 20),
+    (86, 'Primary'): ('goto', 21),
+    (86, 'UnaryExpr'): ('goto', 22),
+    (87, 'Block'): ('goto', 46),
+    (87, 'ExprStmt'): ('goto', 47),
+    (87, 'MatchedStmt'): ('goto', 89),
+    (87, 'UnmatchedStmt'): ('goto', 90),
+    (87, 'VarDecl'): ('goto', 52),
+    (91, 'Block'): ('goto', 46),
+    (91, 'ExprStmt'): ('goto', 47),
+    (91, 'MatchedStmt'): ('goto', 92),
+    (91, 'UnmatchedStmt'): ('goto', 93),
+    (91, 'VarDecl'): ('goto', 52),
+}